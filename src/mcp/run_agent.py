@@ -3,7 +3,8 @@
 OpenFrontIO MCP Agent - AI Player for OpenFrontIO
 
 USAGE:
-  1. Install dependencies: pip install openai
+  1. Install dependencies: pip install openai msgspec
+     (openai and msgspec are required; orjson is optional and speeds up JSON-RPC I/O)
   2. Start a local LLM server (Ollama or KoboldCPP)
   3. Build the MCP server: cd src/mcp && npm run build
   4. Start the game: npm run dev (and begin a singleplayer match)
@@ -14,7 +15,8 @@ CONFIGURATION:
     * KoboldCPP: http://localhost:5001/v1 (default)
     * Ollama: http://localhost:11434/v1
   - MODEL_NAME: Your LLM model name (e.g., "llama3")
-  - TURN_INTERVAL_SECONDS: Time between AI decisions
+  - TURN_INTERVAL_SECONDS: Time between AI decisions (grows up to
+    MAX_IDLE_BACKOFF_MULTIPLIER times while the AI makes no tool calls)
 
 HOW IT WORKS:
   1. Starts the Node.js MCP server as a subprocess
@@ -33,18 +35,98 @@ NO API KEYS REQUIRED - This script only works with local LLMs.
 
 import subprocess
 import json
+import hashlib
+import io
+import logging
+import math
+import re
 import sys
 import time
 import threading
 import queue
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional, List, Tuple, Union
+import msgspec
 from openai import OpenAI
 
+try:
+    # Optional C-accelerated JSON codec for the MCP wire format
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode('utf-8')
+    
+    _json_loads = json.loads
+
 
 # Configuration
 LLM_BASE_URL = "http://localhost:11434/v1"  # http://localhost:5001/v1 for KoboldCPP, http://localhost:11434/v1 for Ollama
 MODEL_NAME = "qwen3:4b"  # Model name for the LLM
 TURN_INTERVAL_SECONDS = 5  # Time between AI turns
+MAX_IDLE_BACKOFF_MULTIPLIER = 8  # Max factor the turn interval grows by while the AI makes no tool calls
+TURN_ERROR_BACKOFF_SECONDS = 10  # Wait after a failed turn (e.g. LLM server down) before retrying
+MCP_PROTOCOL_VERSION = "2025-06-18"  # Protocol version requested during the initialize handshake
+REQUEST_TIMEOUT_SECONDS = 30  # Max time to wait for an MCP response
+DECISION_CACHE_SIZE = 64  # Max number of LLM decisions remembered per game state fingerprint
+DECISION_CACHE_BUCKETS_PER_DOUBLING = 2  # Resolution of troop/gold/land counts in the cache key
+
+# Tools that change the game world. Decisions using them are never cached, and running
+# one invalidates every cached decision.
+COMMAND_TOOLS = frozenset({"game.send_intent", "game.set_attack_ratio"})
+
+# Static system message shared by every turn
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an AI agent playing OpenFrontIO. Use the available tools to explore and take actions."
+}
+
+# Prompt template for the per-turn status header; only the dynamic fields are filled in
+PROMPT_HEADER = """You are playing OpenFrontIO, a strategy game.
+
+**Game Tick:** {tick}
+**Your Player ID:** {player_id}
+
+**Your Status:**
+- Alive: {alive}
+- Troops: {troops}
+- Gold: {gold}
+- Cities: {cities}
+- Land: {land} tiles
+
+**All Players:**
+"""
+
+# Static instructions appended to every prompt
+PROMPT_INSTRUCTIONS = """\n**Instructions:**
+Your goal is to expand your territory and eliminate opponents. You have access to three tools:
+1. `game.get_player_actions` - Get available actions for a specific tile (x, y)
+2. `game.send_intent` - Send an action intent to the game (build, attack, etc.)
+3. `game.set_attack_ratio` - Set your attack ratio (0.0 to 1.0, ratio of troops to send in attacks)
+
+Think strategically and make decisions to grow your empire. Use the tools to explore the map and take actions.
+"""
+
+# MCP server stderr is forwarded through this logger; raise the level to WARNING to
+# silence the stream entirely
+logger = logging.getLogger("mcp")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_stderr_handler = logging.StreamHandler(sys.stderr)
+_stderr_handler.setFormatter(logging.Formatter("[MCP Server] %(message)s"))
+logger.addHandler(_stderr_handler)
+
+# Constant head of every tools/call request; the envelope is assembled from bytes
+_TOOL_CALL_PREFIX = b'{"jsonrpc":"2.0","method":"tools/call","id":'
+
+# Noisy per-tick MCP server log lines that are dropped to keep the console readable
+_NOISE_RE = re.compile(
+    r"Received game update|Broadcasting game update|Game state updated|Tick:|packedTileUpdates"
+)
 
 
 class MCPClient:
@@ -52,75 +134,164 @@ class MCPClient:
     
     def __init__(self, server_process: subprocess.Popen):
         self.process = server_process
+        # Read JSON-RPC lines through a buffer so one read() syscall serves many lines
+        if isinstance(server_process.stdout, io.BufferedReader):
+            self.stdout = server_process.stdout
+        else:
+            self.stdout = io.BufferedReader(server_process.stdout, buffer_size=65536)
         self.request_id = 0
-        self.stderr_queue = queue.Queue()
+        # Serializes id allocation and stdin writes so concurrent callers don't interleave
+        self._write_lock = threading.Lock()
+        self.protocol_version = ""
+        self.server_capabilities: Dict[str, Any] = {}
+        # Futures for in-flight requests, keyed by JSON-RPC id
+        self._pending: Dict[int, Future] = {}
+        self._reader_closed = False
+        # Set whenever the server notifies that a subscribed resource changed
+        self.resource_updated = threading.Event()
+        # Only needed until the game connects; set to None afterwards
+        self.stderr_queue: Optional[queue.Queue] = queue.Queue()
         
         # Start stderr reader thread
         self.stderr_thread = threading.Thread(target=self._read_stderr, daemon=True)
         self.stderr_thread.start()
+        
+        # Start stdout reader thread (routes responses and notifications)
+        self.stdout_thread = threading.Thread(target=self._read_stdout, daemon=True)
+        self.stdout_thread.start()
+    
+    def _read_stdout(self):
+        """Read JSON-RPC messages from the MCP server and route them by id."""
+        try:
+            for line in self.stdout:
+                try:
+                    message = _json_loads(line)
+                except ValueError:  # Also covers invalid UTF-8
+                    print(f"⚠️  Ignoring malformed MCP message: {line[:200]!r}", file=sys.stderr)
+                    continue
+                if not isinstance(message, dict):
+                    continue
+                
+                if "method" in message:
+                    self._handle_notification(message)
+                    continue
+                future = self._pending.pop(message.get("id"), None)
+                if future is not None:
+                    future.set_result(message)
+        finally:
+            # Stdout closed or the reader died: refuse new requests, then fail anyone
+            # still waiting. Setting the flag under the lock means no request can be
+            # registered after the pending map is drained.
+            with self._write_lock:
+                self._reader_closed = True
+            for request_id in list(self._pending):
+                future = self._pending.pop(request_id, None)
+                if future is not None:
+                    future.set_exception(RuntimeError("MCP server closed stdout"))
+    
+    def _handle_notification(self, message: Dict[str, Any]):
+        """Handle a notification (or request) initiated by the MCP server."""
+        if message["method"] == "notifications/resources/updated":
+            self.resource_updated.set()
     
     def _read_stderr(self):
         """Read stderr from the MCP server for logging."""
         for line in self.process.stderr:
             decoded = line.decode('utf-8').strip()
-            self.stderr_queue.put(decoded)
             
             # Filter out noisy game update logs to keep console readable
-            if any(noise in decoded for noise in [
-                "Received game update",
-                "Broadcasting game update",
-                "Game state updated",
-                "Tick:",
-                "packedTileUpdates"
-            ]):
+            if _NOISE_RE.search(decoded):
                 continue  # Skip noisy logs
             
-            # Only print important messages
-            print(f"[MCP Server] {decoded}", file=sys.stderr)
+            stderr_queue = self.stderr_queue
+            if stderr_queue is not None:
+                stderr_queue.put(decoded)
+            
+            # Only log important messages
+            logger.info("%s", decoded)
     
     def wait_for_connection(self, timeout: int = 30):
         """Wait for the 'Game connected successfully' message from the MCP server."""
         print("⏳ Waiting for game to connect to MCP server...")
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         
-        while time.time() - start_time < timeout:
+        # Block until the next stderr line arrives instead of polling
+        while (remaining := deadline - time.monotonic()) > 0:
             try:
-                line = self.stderr_queue.get(timeout=0.1)
-                if "Game connected successfully" in line:
-                    print("✅ Game connected to MCP server!")
-                    return True
+                line = self.stderr_queue.get(timeout=remaining)
             except queue.Empty:
-                continue
+                break
+            if "Game connected successfully" in line:
+                print("✅ Game connected to MCP server!")
+                # Nothing reads stderr lines after this, so stop buffering them
+                self.stderr_queue = None
+                return True
         
         raise TimeoutError("Game failed to connect to MCP server within timeout")
     
-    def send_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
-        """Send a JSON-RPC request to the MCP server and return the result."""
-        self.request_id += 1
-        request = {
+    def initialize(self) -> Dict[str, Any]:
+        """Perform the MCP initialize handshake and record the negotiated protocol."""
+        result = self.send_request("initialize", {
+            "protocolVersion": MCP_PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": {"name": "openfront-agent", "version": "1.0.0"}
+        })
+        self.protocol_version = result.get("protocolVersion", "")
+        self.server_capabilities = result.get("capabilities", {})
+        self.send_notification("notifications/initialized")
+        return result
+    
+    def send_notification(self, method: str, params: Optional[Dict[str, Any]] = None):
+        """Send a JSON-RPC notification (no response expected) to the MCP server."""
+        notification = {
             "jsonrpc": "2.0",
-            "id": self.request_id,
             "method": method,
             "params": params or {}
         }
+        with self._write_lock:
+            self.process.stdin.write(_json_dumps(notification) + b"\n")
+            self.process.stdin.flush()
+    
+    def send_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Send a JSON-RPC request to the MCP server and return the result."""
+        # The stdout reader resolves the future when the response with this id arrives
+        future: Future = Future()
+        with self._write_lock:
+            if self._reader_closed:
+                raise RuntimeError("MCP server closed stdout")
+            self.request_id += 1
+            request_id = self.request_id
+            self._pending[request_id] = future
+            
+            # Send request
+            self.process.stdin.write(self._encode_request(request_id, method, params or {}) + b"\n")
+            self.process.stdin.flush()
         
-        # Send request
-        request_str = json.dumps(request) + "\n"
-        self.process.stdin.write(request_str.encode('utf-8'))
-        self.process.stdin.flush()
-        
-        # Read response
-        response_line = self.process.stdout.readline()
-        if not response_line:
-            raise RuntimeError("MCP server closed stdout")
-        
-        response = json.loads(response_line.decode('utf-8'))
+        # Wait for the response; other callers' requests can be in flight at the same time
+        try:
+            response = future.result(timeout=REQUEST_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            raise TimeoutError(f"MCP server did not respond within {REQUEST_TIMEOUT_SECONDS}s")
+        finally:
+            self._pending.pop(request_id, None)
         
         if "error" in response:
             raise RuntimeError(f"MCP error: {response['error']}")
         
         return response.get("result")
     
+    def _encode_request(self, request_id: int, method: str, params: Dict[str, Any]) -> bytes:
+        """Encode a single JSON-RPC request (without the trailing newline)."""
+        if method == "tools/call":
+            # Hot path: only the id and params vary, so skip building the envelope dict
+            return _TOOL_CALL_PREFIX + str(request_id).encode('ascii') + b',"params":' + _json_dumps(params) + b"}"
+        return _json_dumps({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": method,
+            "params": params
+        })
+    
     def list_resources(self) -> List[Dict[str, Any]]:
         """List all available resources."""
         result = self.send_request("resources/list")
@@ -134,6 +305,10 @@ class MCPClient:
             return contents[0].get("text", "")
         return ""
     
+    def subscribe_resource(self, uri: str):
+        """Subscribe to update notifications for a resource."""
+        self.send_request("resources/subscribe", {"uri": uri})
+    
     def list_tools(self) -> List[Dict[str, Any]]:
         """List all available tools."""
         result = self.send_request("tools/list")
@@ -145,16 +320,90 @@ class MCPClient:
             "name": name,
             "arguments": arguments
         })
+        return self._parse_tool_result(result)
+    
+    def _parse_tool_result(self, result: Dict[str, Any]) -> Any:
+        """Extract the (JSON-decoded when possible) text content of a tool result."""
         contents = result.get("content", [])
         if contents:
             text = contents[0].get("text", "")
             try:
-                return json.loads(text)
+                return _json_loads(text)
             except json.JSONDecodeError:
                 return text
         return None
 
 
+class StreamedToolCall:
+    """Accumulates the fragments of one tool call streamed by the LLM."""
+    
+    def __init__(self):
+        self.name = ""
+        self.dispatched = False
+        self._arguments: List[str] = []
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, fragment: str):
+        """Append an arguments fragment, tracking JSON nesting depth."""
+        self._arguments.append(fragment)
+        for char in fragment:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                self._started = True
+            elif char in "}]":
+                self._depth -= 1
+    
+    @property
+    def complete(self) -> bool:
+        """Whether the name is known and the arguments form a balanced JSON value."""
+        return bool(self.name) and self._started and self._depth == 0
+    
+    def parse(self) -> Tuple[str, Dict[str, Any]]:
+        """Return the (tool name, decoded arguments) pair."""
+        return self.name, _json_loads("".join(self._arguments) or "{}")
+
+
+def _magnitude_bucket(value: Union[int, float, None]) -> int:
+    """Coarsen a count into logarithmic buckets so per-tick growth keeps the same cache key."""
+    if not value or value <= 0:
+        return 0
+    return int(math.log2(value + 1) * DECISION_CACHE_BUCKETS_PER_DOUBLING)
+
+
+# Numeric fields accept null and floats so that loosely-typed server output degrades
+# gracefully instead of failing the whole turn
+OptionalNumber = Union[int, float, None]
+
+
+class Player(msgspec.Struct):
+    """A player entry of the game://state resource."""
+    id: Union[int, float, str, None] = None
+    troops: OptionalNumber = 0
+    gold: OptionalNumber = 0
+    cities: OptionalNumber = 0
+    land: OptionalNumber = 0
+    is_alive: Optional[bool] = msgspec.field(default=False, name="isAlive")
+
+
+class GameState(msgspec.Struct):
+    """The parts of the game://state resource used to build prompts."""
+    player_id: Union[int, float, str, None] = msgspec.field(default=0, name="playerID")
+    tick: OptionalNumber = 0
+    players: Optional[List[Player]] = []
+
+
 class GameAgent:
     """AI agent that plays OpenFrontIO using an LLM."""
     
@@ -162,11 +411,18 @@ class GameAgent:
         self.mcp = mcp_client
         self.llm = llm_client
         self.tools = []
-        self.map_summary = None
+        self._openai_tools: List[Dict[str, Any]] = []
         self.turn_count = 0
+        # Doubles after every turn without tool calls, reset by any tool call
+        self._idle_multiplier = 1
+        self._last_turn_failed = False
+        # Runs streamed tool calls in order while the LLM is still generating
+        self._tool_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tool-call")
+        # (tool calls, message content) of past decisions, keyed by game state fingerprint
+        self._decision_cache: "OrderedDict[str, Tuple[List[Tuple[str, Dict[str, Any]]], Optional[str]]]" = OrderedDict()
     
     def initialize(self):
-        """Initialize the agent by fetching tools and map summary.
+        """Initialize the agent by fetching tools.
         
         IMPORTANT: Tools are dynamically fetched from the MCP server at runtime.
         This ensures that any changes to tool definitions in TypeScript code
@@ -182,62 +438,74 @@ class GameAgent:
         for tool in self.tools:
             print(f"   - {tool['name']}: {tool.get('description', 'No description')}")
         
-        # Fetch map summary (only once)
-        try:
-            self.map_summary = self.mcp.read_resource("game://map/summary")
-            print("🗺️  Map summary loaded")
-        except Exception as e:
-            print(f"⚠️  Could not load map summary: {e}")
+        # Let the server wake us up when the game state changes, if it supports it
+        if self.mcp.server_capabilities.get("resources", {}).get("subscribe"):
+            self.mcp.subscribe_resource("game://state")
+            print("📡 Subscribed to game state updates")
+        
+        # Tool definitions never change after this point, so convert them once
+        self._openai_tools = self._build_openai_tools()
     
-    def get_game_state(self) -> Dict[str, Any]:
+    def get_game_state(self) -> GameState:
         """Fetch the current game state."""
         state_json = self.mcp.read_resource("game://state")
-        return json.loads(state_json)
+        return msgspec.json.decode(state_json, type=GameState)
+    
+    def state_fingerprint(self, game_state: GameState) -> str:
+        """Hash a coarsened view of the game state that the prompt is built from.
+        
+        The tick is left out and troops, gold and land are bucketed by order of
+        magnitude, since all of them change every tick; otherwise consecutive turns
+        would never share a fingerprint.
+        """
+        key = {
+            "playerID": game_state.player_id,
+            "players": [
+                [p.id, _magnitude_bucket(p.land), _magnitude_bucket(p.troops),
+                 _magnitude_bucket(p.gold), p.cities, p.is_alive]
+                for p in game_state.players or []
+            ]
+        }
+        return hashlib.blake2b(_json_dumps(key), digest_size=16).hexdigest()
     
-    def construct_prompt(self, game_state: Dict[str, Any]) -> str:
+    def construct_prompt(self, game_state: GameState) -> str:
         """Construct a prompt for the LLM with current game state."""
-        player_id = game_state.get("playerID", 0)
-        tick = game_state.get("tick", 0)
+        player_id = game_state.player_id
+        tick = game_state.tick
+        players = game_state.players or []
         
         # Find player info
-        player_info = None
-        for player in game_state.get("players", []):
-            if player.get("id") == player_id:
-                player_info = player
-                break
+        players_by_id = {player.id: player for player in players}
+        player_info = players_by_id.get(player_id)
         
-        if not player_info:
+        if player_info is None:
             return "You are playing OpenFrontIO. Could not find your player information."
         
-        prompt = f"""You are playing OpenFrontIO, a strategy game.
-
-**Game Tick:** {tick}
-**Your Player ID:** {player_id}
-
-**Your Status:**
-- Alive: {player_info.get('isAlive', False)}
-- Troops: {player_info.get('troops', 0)}
-- Gold: {player_info.get('gold', 0)}
-- Cities: {player_info.get('cities', 0)}
-- Land: {player_info.get('land', 0)} tiles
-
-**All Players:**
-"""
-        for p in game_state.get("players", []):
-            you = " (YOU)" if p.get("id") == player_id else ""
-            prompt += f"- Player {p.get('id')}{you}: {p.get('land', 0)} land, {p.get('troops', 0)} troops, {'Alive' if p.get('isAlive') else 'Dead'}\n"
+        parts = [PROMPT_HEADER.format(
+            tick=tick,
+            player_id=player_id,
+            alive=player_info.is_alive,
+            troops=player_info.troops,
+            gold=player_info.gold,
+            cities=player_info.cities,
+            land=player_info.land
+        )]
+        for p in players:
+            you = " (YOU)" if p.id == player_id else ""
+            parts.append(f"- Player {p.id}{you}: {p.land} land, {p.troops} troops, {'Alive' if p.is_alive else 'Dead'}\n")
         
-        prompt += """\n**Instructions:**
-Your goal is to expand your territory and eliminate opponents. You have access to three tools:
-1. `game.get_player_actions` - Get available actions for a specific tile (x, y)
-2. `game.send_intent` - Send an action intent to the game (build, attack, etc.)
-3. `game.set_attack_ratio` - Set your attack ratio (0.0 to 1.0, ratio of troops to send in attacks)
-
-Think strategically and make decisions to grow your empire. Use the tools to explore the map and take actions.
-"""
-        return prompt
+        parts.append(PROMPT_INSTRUCTIONS)
+        return "".join(parts)
     
     def convert_mcp_tools_to_openai_format(self) -> List[Dict[str, Any]]:
+        """Return the MCP tool definitions in OpenAI function calling format.
+        
+        The conversion is computed once in initialize() from the tools fetched from
+        the MCP server, and the same list is reused for every turn.
+        """
+        return self._openai_tools
+    
+    def _build_openai_tools(self) -> List[Dict[str, Any]]:
         """Convert MCP tool definitions to OpenAI function calling format.
         
         This conversion happens at runtime using the tools fetched from the MCP server.
@@ -260,6 +528,100 @@ Think strategically and make decisions to grow your empire. Use the tools to exp
         
         return openai_tools
     
+    def query_llm(self, game_state: GameState) -> Tuple[List[Tuple[str, Dict[str, Any]]], Optional[str], List[Any]]:
+        """Ask the LLM for a decision, executing tool calls as soon as they finish streaming.
+        
+        Returns the (tool name, arguments) calls, the message content and the tool results.
+        """
+        # Construct prompt
+        prompt = self.construct_prompt(game_state)
+        
+        # Query LLM
+        print("🤔 Thinking...")
+        openai_tools = self._openai_tools
+        
+        stream = self.llm.chat.completions.create(
+            model=MODEL_NAME,
+            messages=[
+                SYSTEM_MESSAGE,
+                {"role": "user", "content": prompt}
+            ],
+            tools=openai_tools if openai_tools else None,
+            tool_choice="auto" if openai_tools else None,
+            temperature=0.7,
+            stream=True
+        )
+        
+        content_parts: List[str] = []
+        streamed_calls: Dict[int, StreamedToolCall] = {}
+        calls: List[Tuple[str, Dict[str, Any]]] = []
+        pending_results = []
+        
+        def dispatch(streamed_call: StreamedToolCall):
+            streamed_call.dispatched = True
+            function_name, arguments = streamed_call.parse()
+            self._print_tool_call(function_name, arguments)
+            calls.append((function_name, arguments))
+            pending_results.append(self._tool_executor.submit(self.mcp.call_tool, function_name, arguments))
+        
+        def dispatch_ready(stream_done: bool = False):
+            # Calls run in index order: a call goes out once it is finished and every
+            # earlier one has gone out. It is finished when its arguments are balanced,
+            # when the LLM has started a later call, or when the stream has ended.
+            last_index = max(streamed_calls, default=-1)
+            for index in sorted(streamed_calls):
+                streamed_call = streamed_calls[index]
+                if streamed_call.dispatched:
+                    continue
+                if not (stream_done or streamed_call.complete or index < last_index):
+                    break
+                dispatch(streamed_call)
+        
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content_parts.append(delta.content)
+            
+            for fragment in delta.tool_calls or []:
+                streamed_call = streamed_calls.setdefault(fragment.index, StreamedToolCall())
+                if fragment.function:
+                    if fragment.function.name:
+                        streamed_call.name += fragment.function.name
+                    if fragment.function.arguments:
+                        streamed_call.feed(fragment.function.arguments)
+                
+                # Start tools while the LLM keeps generating the rest of the response
+                dispatch_ready()
+        
+        # Dispatch calls whose arguments never formed a balanced value (e.g. no arguments)
+        dispatch_ready(stream_done=True)
+        
+        results = [pending.result() for pending in pending_results]
+        return calls, "".join(content_parts) or None, results
+    
+    def _print_tool_call(self, function_name: str, arguments: Dict[str, Any]):
+        """Log a tool call requested by the LLM."""
+        print(f"🤖 AI calling tool: {function_name}")
+        print(f"   Arguments: {json.dumps(arguments, indent=2)}")
+    
+    def next_turn_delay(self) -> float:
+        """Return the time until the next turn, backing off while idle or failing."""
+        if self._last_turn_failed:
+            return TURN_ERROR_BACKOFF_SECONDS
+        return TURN_INTERVAL_SECONDS * self._idle_multiplier
+    
+    def wait_for_next_turn(self):
+        """Block until the next turn is due."""
+        if self._last_turn_failed or self._idle_multiplier > 1:
+            # Backing off: state updates arrive every tick, so they must not cut the wait short
+            time.sleep(self.next_turn_delay())
+        else:
+            # Wake up early if the server reports a game state update
+            self.mcp.resource_updated.wait(timeout=self.next_turn_delay())
+        self.mcp.resource_updated.clear()
+    
     def execute_turn(self):
         """Execute one AI turn."""
         self.turn_count += 1
@@ -271,43 +633,41 @@ Think strategically and make decisions to grow your empire. Use the tools to exp
             # Get current game state
             game_state = self.get_game_state()
             
-            # Construct prompt
-            prompt = self.construct_prompt(game_state)
-            
-            # Query LLM
-            print("🤔 Thinking...")
-            openai_tools = self.convert_mcp_tools_to_openai_format()
+            fingerprint = self.state_fingerprint(game_state)
+            cached = self._decision_cache.get(fingerprint)
             
-            response = self.llm.chat.completions.create(
-                model=MODEL_NAME,
-                messages=[
-                    {"role": "system", "content": "You are an AI agent playing OpenFrontIO. Use the available tools to explore and take actions."},
-                    {"role": "user", "content": prompt}
-                ],
-                tools=openai_tools if openai_tools else None,
-                tool_choice="auto" if openai_tools else None,
-                temperature=0.7
-            )
-            
-            message = response.choices[0].message
+            if cached is not None:
+                # Game state is unchanged, so reuse the previous decision instead of asking the LLM
+                self._decision_cache.move_to_end(fingerprint)
+                cached_calls, content = cached
+                print("♻️  Reusing cached decision for unchanged game state")
+                # Cached decisions only contain informational calls, whose results are
+                # never fed back to the LLM, so there is nothing worth re-running
+                if cached_calls:
+                    print(f"   Skipping {len(cached_calls)} informational tool call(s)")
+                calls, results = [], []
+            else:
+                calls, content, results = self.query_llm(game_state)
+                if any(name in COMMAND_TOOLS for name, _ in calls):
+                    # The world has changed, so earlier decisions no longer apply
+                    self._decision_cache.clear()
+                else:
+                    self._decision_cache[fingerprint] = (calls, content)
+                    if len(self._decision_cache) > DECISION_CACHE_SIZE:
+                        self._decision_cache.popitem(last=False)
             
-            # Check if LLM wants to call tools
-            if hasattr(message, 'tool_calls') and message.tool_calls:
-                for tool_call in message.tool_calls:
-                    function_name = tool_call.function.name
-                    arguments = json.loads(tool_call.function.arguments)
-                    
-                    print(f"🤖 AI calling tool: {function_name}")
-                    print(f"   Arguments: {json.dumps(arguments, indent=2)}")
-                    
-                    # Execute the tool
-                    result = self.mcp.call_tool(function_name, arguments)
-                    print(f"   Result: {json.dumps(result, indent=2)}")
+            if calls:
+                for (function_name, _), result in zip(calls, results):
+                    print(f"   Result ({function_name}): {json.dumps(result, indent=2)}")
+                self._idle_multiplier = 1
             else:
                 # LLM didn't call any tools, just responded
-                print(f"💭 AI: {message.content}")
+                print(f"💭 AI: {content}")
+                self._idle_multiplier = min(self._idle_multiplier * 2, MAX_IDLE_BACKOFF_MULTIPLIER)
+            self._last_turn_failed = False
         
         except Exception as e:
+            self._last_turn_failed = True
             print(f"❌ Error during turn: {e}")
             import traceback
             traceback.print_exc()
@@ -327,7 +687,7 @@ def main():
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        bufsize=0
+        bufsize=65536
     )
     
     try:
@@ -337,6 +697,9 @@ def main():
         # Wait for game connection
         mcp_client.wait_for_connection()
         
+        # Negotiate protocol version and capabilities
+        mcp_client.initialize()
+        
         # Create LLM client (no API key needed for local LLMs)
         llm_client = OpenAI(
             base_url=LLM_BASE_URL,
@@ -347,13 +710,15 @@ def main():
         agent = GameAgent(mcp_client, llm_client)
         agent.initialize()
         
-        print(f"\n🎯 Starting AI turn loop (every {TURN_INTERVAL_SECONDS} seconds)")
+        print(f"\n🎯 Starting AI turn loop (every {TURN_INTERVAL_SECONDS} seconds, backing off up to "
+              f"{TURN_INTERVAL_SECONDS * MAX_IDLE_BACKOFF_MULTIPLIER} seconds while idle and "
+              f"{TURN_ERROR_BACKOFF_SECONDS} seconds after a failed turn)")
         print("   Press Ctrl+C to stop\n")
         
         # Main turn loop
         while True:
             agent.execute_turn()
-            time.sleep(TURN_INTERVAL_SECONDS)
+            agent.wait_for_next_turn()
     
     except KeyboardInterrupt:
         print("\n\n⏹️  Stopping agent...")